@@ -9,13 +9,21 @@ visualizations, and detailed insights.
 from __future__ import annotations
 
 import os
+from typing import Sequence, Tuple
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 import streamlit as st
 
 import config
-from inference import predict_engine_condition
+from inference import PredictionBatcher, load_model
+from ui_constants import CUSTOM_CSS, FEATURE_ORDER, MAX_VALUES_ARR, RADAR_THETA
+
+# Serialize figures with orjson (listed in requirements) instead of stdlib json
+pio.json.config.default_engine = "orjson"
 
 
 def _is_running_in_hf_space() -> bool:
@@ -34,71 +42,154 @@ def _get_default_source() -> str:
     return "local"
 
 
+@st.cache_resource(show_spinner=False)
+def _environment_status() -> Tuple[bool, str, bool]:
+    """
+    Return (running in HF Space, default model source, HF model configured).
+
+    The environment does not change while the app is running, so this is
+    evaluated once per process rather than on every rerun.
+    """
+    return (
+        _is_running_in_hf_space(),
+        _get_default_source(),
+        bool(config.HF_TOKEN and config.HF_MODEL_REPO),
+    )
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _local_model_exists() -> bool:
+    """Check for a local model, refreshed every 30s rather than per rerun."""
+    return os.path.exists(config.BEST_MODEL_LOCAL_PATH)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_model(source: str):
+    """Load the model once per source and keep it across reruns."""
+    return load_model(source)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_batcher(source: str) -> PredictionBatcher:
+    """Shared prediction batcher so concurrent sessions score together."""
+    return PredictionBatcher(_get_model(source))
+
+
 def create_gauge_chart(value: float, title: str, color: str) -> go.Figure:
     """Create a gauge chart for sensor readings."""
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=value,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': title, 'font': {'size': 16}},
-        gauge={
-            'axis': {'range': [None, 100]},
-            'bar': {'color': color},
-            'steps': [
-                {'range': [0, 50], 'color': "lightgray"},
-                {'range': [50, 80], 'color': "gray"}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': 90
+    # Dict-based traces/layout skip building intermediate graph objects
+    return go.Figure(
+        data=[dict(
+            type="indicator",
+            mode="gauge+number",
+            value=value,
+            domain={'x': [0, 1], 'y': [0, 1]},
+            title={'text': title, 'font': {'size': 16}},
+            gauge={
+                'axis': {'range': [None, 100]},
+                'bar': {'color': color},
+                'steps': [
+                    {'range': [0, 50], 'color': "lightgray"},
+                    {'range': [50, 80], 'color': "gray"}
+                ],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 90
+                }
             }
-        }
-    ))
-    fig.update_layout(height=200, margin=dict(l=20, r=20, t=40, b=20))
-    return fig
+        )],
+        layout=dict(height=200, margin=dict(l=20, r=20, t=40, b=20)),
+    )
 
 
-def create_sensor_comparison_chart(sensor_data: dict) -> go.Figure:
-    """Create a radar chart comparing sensor values."""
-    categories = list(sensor_data.keys())
-    values = list(sensor_data.values())
-    
+def create_sensor_comparison_chart(values: Sequence[float]) -> go.Figure:
+    """
+    Create a radar chart comparing sensor values.
+
+    `values` must be given in `FEATURE_ORDER`.
+    """
     # Normalize values for better visualization (0-100 scale)
-    max_values = {
-        "Engine_RPM": 4000,
-        "Lub_Oil_Pressure": 10,
-        "Fuel_Pressure": 30,
-        "Coolant_Pressure": 10,
-        "Lub_Oil_Temperature": 150,
-        "Coolant_Temperature": 150,
-    }
-    
-    normalized_values = [
-        (v / max_values.get(k, 100)) * 100 for k, v in zip(categories, values)
-    ]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=normalized_values + [normalized_values[0]],  # Close the loop
-        theta=[k.replace("_", " ") for k in categories] + [categories[0].replace("_", " ")],
-        fill='toself',
-        name='Current Readings',
-        line_color='#1f77b4'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100]
-            )),
-        showlegend=True,
-        height=400,
-        title="Sensor Readings Overview"
+    normalized_values = (
+        np.asarray(values, dtype=np.float32) / MAX_VALUES_ARR * 100.0
+    ).tolist()
+
+    return go.Figure(
+        data=[dict(
+            type="scatterpolargl",
+            r=normalized_values + [normalized_values[0]],  # Close the loop
+            theta=RADAR_THETA,
+            fill='toself',
+            name='Current Readings',
+            line=dict(color='#1f77b4'),
+        )],
+        layout=dict(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 100]
+                )),
+            showlegend=True,
+            height=400,
+            title="Sensor Readings Overview",
+        ),
+    )
+
+
+@st.cache_data(max_entries=128)
+def _radar_fig(
+    rpm: float, lop: float, fp: float, cp: float, lot: float, ct: float
+) -> go.Figure:
+    """Build the sensor radar chart, cached on the rounded sensor values."""
+    fig = create_sensor_comparison_chart((rpm, lop, fp, cp, lot, ct))
+    fig.update_layout(height=450, margin=dict(l=40, r=40, t=50, b=40))  # Larger and more readable
+    return fig
+
+
+def _render_radar(sensor_values: Tuple[float, ...]) -> None:
+    """Render the (cached) radar chart for the submitted sensor values."""
+    radar_fig = _radar_fig(*sensor_values)
+    st.plotly_chart(radar_fig, use_container_width=True, config={'displayModeBar': False})
+
+
+@st.cache_resource(show_spinner=False)
+def _gauge_template() -> go.Figure:
+    """
+    Static parts of the fault-risk gauge, built once on first use; only
+    the value and bar colour change per prediction.
+    """
+    return go.Figure(
+        data=[dict(
+            type="indicator",
+            mode="gauge+number",
+            domain={'x': [0, 1], 'y': [0, 1]},
+            title={'text': "Fault Risk %", 'font': {'size': 16}},
+            gauge={
+                'axis': {'range': [None, 100]},
+                'steps': [
+                    {'range': [0, 30], 'color': "lightgreen"},
+                    {'range': [30, 70], 'color': "yellow"},
+                    {'range': [70, 100], 'color': "lightcoral"}
+                ],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 70
+                }
+            }
+        )],
+        layout=dict(height=200, margin=dict(l=10, r=10, t=30, b=10)),
+    )
+
+
+@st.cache_data(max_entries=128)
+def _fault_gauge_fig(prob_faulty: float, pred_label: int) -> go.Figure:
+    """Build the fault-risk gauge, cached on (probability, label)."""
+    fig = go.Figure(_gauge_template())
+    fig.update_traces(
+        value=prob_faulty * 100,
+        gauge_bar_color="darkred" if pred_label == 1 else "darkgreen",
     )
-    
     return fig
 
 
@@ -112,68 +203,17 @@ def main() -> None:
     )
     
     # Custom CSS for better styling
-    st.markdown("""
-    <style>
-        .main-header {
-            font-size: 2.5rem;
-            font-weight: bold;
-            color: #1f77b4;
-            text-align: center;
-            margin-bottom: 1rem;
-        }
-        .metric-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 1.5rem;
-            border-radius: 10px;
-            color: white;
-            text-align: center;
-            margin: 0.5rem 0;
-        }
-        .prediction-box {
-            padding: 2rem;
-            border-radius: 15px;
-            margin: 1.5rem 0;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }
-        .success-box {
-            background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-            color: white;
-        }
-        .warning-box {
-            background: linear-gradient(135deg, #ee0979 0%, #ff6a00 100%);
-            color: white;
-        }
-        .stSlider > div > div > div {
-            background-color: #1f77b4;
-        }
-        .stButton > button {
-            width: 100%;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            font-weight: bold;
-            font-size: 1.2rem;
-            padding: 0.75rem;
-            border-radius: 10px;
-            border: none;
-            transition: all 0.3s;
-        }
-        .stButton > button:hover {
-            transform: scale(1.05);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
     # Compact Header
     st.markdown('<h1 style="font-size: 2rem; text-align: center; color: #1f77b4; margin-bottom: 0.5rem;">🛠️ Engine Predictive Maintenance</h1>', unsafe_allow_html=True)
     st.markdown('<p style="text-align: center; color: #666; margin-bottom: 1rem; font-size: 0.9rem;">AI-Powered Engine Health Monitoring & Failure Prediction</p>', unsafe_allow_html=True)
 
     # Sidebar
+    is_in_space, default_source, hf_configured = _environment_status()
+
     with st.sidebar:
         # In HF Space, always use HF model and hide selection
-        is_in_space = _is_running_in_hf_space()
-        default_source = _get_default_source()
-        
         if is_in_space:
             # In Space: completely hide model source selection, always use HF
             source = "hf"
@@ -194,7 +234,7 @@ def main() -> None:
         st.header("📊 Quick Stats")
         if is_in_space:
             # In Space: always show HF model status
-            if config.HF_TOKEN and config.HF_MODEL_REPO:
+            if hf_configured:
                 st.success("✅ Model Ready")
                 st.caption(f"Loading from: {config.HF_MODEL_REPO}")
             else:
@@ -208,7 +248,7 @@ def main() -> None:
                 """)
         else:
             # Local development: check local model
-            if os.path.exists(config.BEST_MODEL_LOCAL_PATH):
+            if _local_model_exists():
                 st.success("✅ Model Available")
                 st.caption("Trained model found locally")
             else:
@@ -299,24 +339,20 @@ def main() -> None:
     with col_viz:
         st.markdown("### 📊 Sensor Visualization")
         
-        # Real-time sensor visualization
-        sensor_data = {
-            "Engine_RPM": engine_rpm,
-            "Lub_Oil_Pressure": lub_oil_pressure,
-            "Fuel_Pressure": fuel_pressure,
-            "Coolant_Pressure": coolant_pressure,
-            "Lub_Oil_Temperature": lub_oil_temp,
-            "Coolant_Temperature": coolant_temp,
-        }
-        
-        # Larger, more readable radar chart
-        radar_fig = create_sensor_comparison_chart(sensor_data)
-        radar_fig.update_layout(height=450, margin=dict(l=40, r=40, t=50, b=40))  # Larger and more readable
-        st.plotly_chart(radar_fig, use_container_width=True, config={'displayModeBar': False})
+        # Inputs live inside the form, so this only changes on submit.
+        # Values are rounded to the input step so unchanged readings hit the cache.
+        _render_radar((
+            round(engine_rpm, 0),
+            round(lub_oil_pressure, 1),
+            round(fuel_pressure, 1),
+            round(coolant_pressure, 1),
+            round(lub_oil_temp, 1),
+            round(coolant_temp, 1),
+        ))
 
     # Prediction results
     if submitted:
-        inputs = {
+        readings = {
             "Engine_RPM": engine_rpm,
             "Lub_Oil_Pressure": lub_oil_pressure,
             "Fuel_Pressure": fuel_pressure,
@@ -324,6 +360,8 @@ def main() -> None:
             "Lub_Oil_Temperature": lub_oil_temp,
             "Coolant_Temperature": coolant_temp,
         }
+        # Single sample ordered by FEATURE_ORDER, passed straight to the model
+        X = np.array([[readings[name] for name in FEATURE_ORDER]], dtype=np.float32)
 
         # Check if HF_TOKEN is set when using HF model
         if source == "hf" and not config.HF_TOKEN:
@@ -340,7 +378,7 @@ def main() -> None:
         
         with st.spinner("🤖 Loading model and analyzing sensor data..."):
             try:
-                result = predict_engine_condition(inputs=inputs, source=source)
+                result = _get_batcher(source).predict(X)
             except Exception as e:
                 st.error(
                     f"❌ **Prediction Failed**\n\n"
@@ -388,29 +426,13 @@ def main() -> None:
                 st.success("✅ All sensors within normal ranges. Continue regular monitoring.")
         
         with result_col2:
-            # Compact probability gauge
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=prob_faulty * 100,
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "Fault Risk %", 'font': {'size': 16}},
-                gauge={
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkred" if pred_label == 1 else "darkgreen"},
-                    'steps': [
-                        {'range': [0, 30], 'color': "lightgreen"},
-                        {'range': [30, 70], 'color': "yellow"},
-                        {'range': [70, 100], 'color': "lightcoral"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 70
-                    }
-                }
-            ))
-            fig.update_layout(height=200, margin=dict(l=10, r=10, t=30, b=10))
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+            if config.USE_PLOTLY_FAULT_GAUGE:
+                # Compact probability gauge
+                fig = _fault_gauge_fig(round(prob_faulty, 3), pred_label)
+                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+            else:
+                # Lightweight fault-risk bar
+                st.progress(int(prob_faulty * 100), text=f"Fault Risk: {prob_faulty:.1%}")
             
             # Compact metrics
             col_m1, col_m2 = st.columns(2)
@@ -52,6 +52,13 @@ FEATURE_COLUMNS = [
     "Coolant_Temperature",
 ]
 
+# Compact dtypes kept from ingest through the train/test CSVs and training:
+# float32 for sensor readings, int8 for the binary target.
+COLUMN_DTYPES = {
+    **{col: "float32" for col in FEATURE_COLUMNS},
+    TARGET_COLUMN: "int8",
+}
+
 RANDOM_STATE = 42
 TEST_SIZE = float(os.getenv("TEST_SIZE", "0.2"))
 
@@ -86,4 +93,11 @@ MODELS_DIR = PROJECT_ROOT / "models"
 MODELS_DIR.mkdir(parents=True, exist_ok=True)
 
 BEST_MODEL_LOCAL_PATH = MODELS_DIR / "best_model.joblib"
+BEST_MODEL_ONNX_PATH = MODELS_DIR / "best_model.onnx"
 
+# -------------------------------------------------------------------------
+# Streamlit app
+# -------------------------------------------------------------------------
+# Show the fault risk as a Plotly gauge instead of the lightweight
+# st.progress bar. Set USE_PLOTLY_FAULT_GAUGE=1 to enable.
+USE_PLOTLY_FAULT_GAUGE = os.getenv("USE_PLOTLY_FAULT_GAUGE", "0") == "1"
@@ -4,8 +4,8 @@ Data preparation script for the predictive maintenance project.
 Responsibilities:
 - Load the raw engine dataset from the Hugging Face dataset repo (preferred)
   or from the local data folder as a fallback.
-- Clean and preprocess the data (rename columns, handle missing values,
-  drop duplicates, basic sanity checks).
+- Read only the expected columns with standardized names and compact dtypes.
+- Clean the data (drop duplicates and unlabeled rows, fill missing values).
 - Split the cleaned data into train and test sets.
 - Save train and test CSVs locally.
 - Upload the resulting train and test CSVs back to the Hugging Face dataset repo.
@@ -18,11 +18,32 @@ from typing import Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
 
 import config
 from hf_data_utils import download_dataset_file, upload_dataset_file
 
+# Dtypes keyed by raw CSV column name, so the raw file is parsed straight
+# into the compact schema. The target is read as float so unlabeled rows
+# come through as NaN; `_clean_data` drops them and casts it to int8.
+_RAW_DTYPES = {
+    raw: "float32" if new == config.TARGET_COLUMN else config.COLUMN_DTYPES[new]
+    for raw, new in config.RAW_COLUMN_RENAME_MAP.items()
+}
+
+
+def _read_raw_csv(path: Path) -> pd.DataFrame:
+    """
+    Read the raw engine CSV with only the expected columns, fixed dtypes
+    and standardized column names.
+    """
+    df = pd.read_csv(
+        path,
+        engine="pyarrow",
+        usecols=list(config.RAW_COLUMN_RENAME_MAP),
+        dtype=_RAW_DTYPES,
+    )
+    return df.rename(columns=config.RAW_COLUMN_RENAME_MAP)
+
 
 def _load_raw_data_from_hf_or_local() -> pd.DataFrame:
     """
@@ -32,13 +53,15 @@ def _load_raw_data_from_hf_or_local() -> pd.DataFrame:
     # Preferred: load from HF dataset repo if token and repo are configured
     if config.HF_TOKEN and config.HF_DATASET_REPO:
         try:
+            # Reuse a previous download without a network round trip
             remote_path = download_dataset_file(
                 filename="data/engine_data.csv",
                 repo_id=config.HF_DATASET_REPO,
                 token=config.HF_TOKEN,
                 local_dir=config.DATA_DIR,
+                prefer_local=True,
             )
-            return pd.read_csv(remote_path)
+            return _read_raw_csv(remote_path)
         except Exception:
             # Fall back to local file
             pass
@@ -50,29 +73,26 @@ def _load_raw_data_from_hf_or_local() -> pd.DataFrame:
             "Ensure engine_data.csv exists or upload it to the HF dataset repo."
         )
 
-    return pd.read_csv(config.RAW_DATA_FILE)
+    return _read_raw_csv(config.RAW_DATA_FILE)
 
 
 def _clean_data(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Perform basic cleaning and feature engineering.
+    Perform basic cleaning on the frame returned by
+    `_load_raw_data_from_hf_or_local`, which already has the expected
+    columns, names and feature dtypes.
     """
-    # Standardize column names
-    df = df.rename(columns=config.RAW_COLUMN_RENAME_MAP)
-
-    # Keep only the expected columns (drop any extras, if present)
-    expected_cols = set(config.FEATURE_COLUMNS + [config.TARGET_COLUMN])
-    df = df[[col for col in df.columns if col in expected_cols]]
-
-    # Drop duplicate rows
-    df = df.drop_duplicates().reset_index(drop=True)
+    # Drop duplicate rows and rows without a label
+    df = df.drop_duplicates().dropna(subset=[config.TARGET_COLUMN]).reset_index(drop=True)
+    df[config.TARGET_COLUMN] = df[config.TARGET_COLUMN].astype(
+        config.COLUMN_DTYPES[config.TARGET_COLUMN]
+    )
 
     # Handle missing values: for this numeric dataset, fill with median
-    if df.isna().any().any():
-        df = df.fillna(df.median(numeric_only=True))
-
-    # Ensure target is integer/binary
-    df[config.TARGET_COLUMN] = df[config.TARGET_COLUMN].astype(int)
+    X = df[config.FEATURE_COLUMNS].to_numpy(copy=False)
+    mask = np.isnan(X)
+    if mask.any():
+        df[config.FEATURE_COLUMNS] = np.where(mask, np.nanmedian(X, axis=0), X)
 
     return df
 
@@ -81,24 +101,29 @@ def _train_test_split(
     df: pd.DataFrame,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
-    Split the cleaned dataframe into train and test sets.
-    """
-    X = df[config.FEATURE_COLUMNS]
-    y = df[config.TARGET_COLUMN]
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        X,
-        y,
-        test_size=config.TEST_SIZE,
-        random_state=config.RANDOM_STATE,
-        stratify=y,
-    )
-
-    train_df = X_train.copy()
-    train_df[config.TARGET_COLUMN] = y_train
+    Split the cleaned dataframe into stratified train and test sets.
 
-    test_df = X_test.copy()
-    test_df[config.TARGET_COLUMN] = y_test
+    Each class is shuffled and split separately, then both sets are taken
+    from `df` with a single positional index, so the frame is copied once.
+    """
+    rng = np.random.default_rng(config.RANDOM_STATE)
+    y = df[config.TARGET_COLUMN].to_numpy()
+
+    train_parts = []
+    test_parts = []
+    for label in np.unique(y):
+        idx = np.flatnonzero(y == label)
+        rng.shuffle(idx)
+        n_test = int(len(idx) * config.TEST_SIZE)
+        test_parts.append(idx[:n_test])
+        train_parts.append(idx[n_test:])
+
+    # Interleave the classes so neither split is ordered by label
+    train_idx = rng.permutation(np.concatenate(train_parts))
+    test_idx = rng.permutation(np.concatenate(test_parts))
+
+    train_df = df.iloc[train_idx].reset_index(drop=True)
+    test_df = df.iloc[test_idx].reset_index(drop=True)
 
     return train_df, test_df
 
@@ -16,6 +16,9 @@ from huggingface_hub import HfApi
 
 import config
 
+# Files the Docker Space cannot start without
+REQUIRED_SPACE_FILES = ("Dockerfile", "requirements.txt", "src/app.py")
+
 
 def main() -> None:
     token = config.HF_TOKEN or os.getenv("HF_TOKEN")
@@ -30,6 +33,8 @@ def main() -> None:
             "HF_SPACE_REPO is not set. Set it as an environment variable or in config.py."
         )
 
+    # A single client is reused for every call below; huggingface_hub keeps
+    # one pooled HTTP session per thread underneath it.
     api = HfApi(token=token)
 
     # Create the Space if it does not exist
@@ -81,24 +86,35 @@ Trained Random Forest model with hyperparameter tuning, deployed from Hugging Fa
     )
 
     # Upload project files needed for deployment.
-    # We ignore large local artifacts like raw data, mlruns, and models,
+    # Only the app code, Dockerfile and requirements are allow-listed, so
+    # large local artifacts like raw data, mlruns, and models are never sent,
     # similar to how the reference notebook uploads only the deployment folder.
+    # This stays a single upload_folder commit rather than multi_commits or
+    # upload_large_folder: every commit to a Space triggers a rebuild, and the
+    # handful of small files here gains nothing from sharding.
     api.upload_folder(
         folder_path=str(config.PROJECT_ROOT),
         path_in_repo=".",
         repo_id=space_repo,
         repo_type="space",
+        allow_patterns=[
+            "src/*.py",
+            "Dockerfile",
+            "requirements*.txt",
+            ".streamlit/**",
+        ],
         ignore_patterns=[
-            "data/*",
-            "mlruns/*",
-            "models/*",
-            ".git/*",
             "__pycache__/*",
-            ".github/*",
             "README.md",  # Don't upload project README, use Space-specific one
         ],
     )
 
+    # Make sure the allow-list did not drop anything the Space needs to start
+    uploaded = set(api.list_repo_files(repo_id=space_repo, repo_type="space"))
+    missing = sorted(set(REQUIRED_SPACE_FILES) - uploaded)
+    if missing:
+        print(f"Warning: Space is missing required files: {', '.join(missing)}")
+
     print(f"Deployment files pushed to Hugging Face Space: {space_repo}")
 
 
@@ -14,19 +14,11 @@ All functions expect a valid HF token to be available, typically via:
 from pathlib import Path
 from typing import Optional
 
-from huggingface_hub import HfApi, hf_hub_download
+from huggingface_hub import hf_hub_download
+from huggingface_hub.utils import LocalEntryNotFoundError
 
 import config
-
-
-def _get_token(explicit_token: Optional[str] = None) -> str:
-    token = explicit_token or config.HF_TOKEN
-    if not token:
-        raise ValueError(
-            "Hugging Face token is not set. "
-            "Set HF_TOKEN in the environment or pass token explicitly."
-        )
-    return token
+from hf_transport import get_api, get_token
 
 
 def create_or_get_dataset_repo(
@@ -35,8 +27,8 @@ def create_or_get_dataset_repo(
     """
     Create the dataset repo on Hugging Face Hub if it does not already exist.
     """
-    token = _get_token(token)
-    api = HfApi(token=token)
+    token = get_token(token)
+    api = get_api(token)
     api.create_repo(
         repo_id=repo_id,
         repo_type="dataset",
@@ -67,11 +59,11 @@ def upload_dataset_file(
     token : str, optional
         Hugging Face token. Defaults to config.HF_TOKEN.
     """
-    token = _get_token(token)
+    token = get_token(token)
     repo_id = repo_id or config.HF_DATASET_REPO
     repo_path = repo_path or local_path.name
 
-    api = HfApi(token=token)
+    api = get_api(token)
     create_or_get_dataset_repo(repo_id=repo_id, token=token)
 
     api.upload_file(
@@ -87,6 +79,7 @@ def download_dataset_file(
     repo_id: Optional[str] = None,
     token: Optional[str] = None,
     local_dir: Optional[Path] = None,
+    prefer_local: bool = False,
 ) -> Path:
     """
     Download a file from the Hugging Face dataset repo and return its local path.
@@ -101,20 +94,29 @@ def download_dataset_file(
         Hugging Face token.
     local_dir : Path, optional
         Directory to place the downloaded file. Defaults to config.DATA_DIR.
+    prefer_local : bool
+        If True, return a previously downloaded copy without contacting the
+        Hub when one exists, and only download otherwise.
     """
-    token = _get_token(token)
+    token = get_token(token)
     repo_id = repo_id or config.HF_DATASET_REPO
     local_dir = local_dir or config.DATA_DIR
     local_dir.mkdir(parents=True, exist_ok=True)
 
-    downloaded_path = hf_hub_download(
+    download_kwargs = dict(
         repo_id=repo_id,
         filename=filename,
         repo_type="dataset",
         token=token,
         local_dir=str(local_dir),
-        local_dir_use_symlinks=False,
     )
+    if prefer_local:
+        try:
+            return Path(hf_hub_download(**download_kwargs, local_files_only=True))
+        except LocalEntryNotFoundError:
+            pass
+
+    downloaded_path = hf_hub_download(**download_kwargs)
     return Path(downloaded_path)
 
 
@@ -10,19 +10,10 @@ from pathlib import Path
 from typing import Optional
 
 import joblib
-from huggingface_hub import HfApi, hf_hub_download
+from huggingface_hub import hf_hub_download
 
 import config
-
-
-def _get_token(explicit_token: Optional[str] = None) -> str:
-    token = explicit_token or config.HF_TOKEN
-    if not token:
-        raise ValueError(
-            "Hugging Face token is not set. "
-            "Set HF_TOKEN in the environment or pass token explicitly."
-        )
-    return token
+from hf_transport import get_api, get_token
 
 
 def create_or_get_model_repo(
@@ -31,8 +22,8 @@ def create_or_get_model_repo(
     """
     Create the model repo on Hugging Face Hub if it does not already exist.
     """
-    token = _get_token(token)
-    api = HfApi(token=token)
+    token = get_token(token)
+    api = get_api(token)
     api.create_repo(
         repo_id=repo_id,
         repo_type="model",
@@ -50,10 +41,10 @@ def upload_model(
     """
     Upload the trained model artifact to the Hugging Face model hub.
     """
-    token = _get_token(token)
+    token = get_token(token)
     repo_id = repo_id or config.HF_MODEL_REPO
 
-    api = HfApi(token=token)
+    api = get_api(token)
     create_or_get_model_repo(repo_id=repo_id, token=token)
 
     api.upload_file(
@@ -73,7 +64,7 @@ def download_model(
     """
     Download a model artifact from the Hugging Face model hub and load it.
     """
-    token = _get_token(token)
+    token = get_token(token)
     repo_id = repo_id or config.HF_MODEL_REPO
     local_dir = local_dir or config.MODELS_DIR
     local_dir.mkdir(parents=True, exist_ok=True)
@@ -84,7 +75,6 @@ def download_model(
         repo_type="model",
         token=token,
         local_dir=str(local_dir),
-        local_dir_use_symlinks=False,
     )
 
     return joblib.load(downloaded_path)
@@ -0,0 +1,31 @@
+"""
+Shared Hugging Face Hub helpers for the dataset and model utilities.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from huggingface_hub import HfApi
+
+import config
+
+
+@lru_cache(maxsize=None)
+def get_token(explicit_token: Optional[str] = None) -> str:
+    token = explicit_token or config.HF_TOKEN
+    if not token:
+        raise ValueError(
+            "Hugging Face token is not set. "
+            "Set HF_TOKEN in the environment or pass token explicitly."
+        )
+    return token
+
+
+@lru_cache(maxsize=4)
+def get_api(token: str) -> HfApi:
+    """
+    Return a shared HfApi client per token so repeated calls skip
+    re-constructing it. Connection reuse comes from huggingface_hub's own
+    per-thread HTTP session, not from this cache.
+    """
+    return HfApi(token=token)
@@ -8,7 +8,12 @@ generate predictions from raw sensor values.
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, Optional
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import joblib
 import numpy as np
@@ -17,10 +22,23 @@ import pandas as pd
 import config
 from hf_model_utils import download_model
 
+try:
+    import onnxruntime as ort
+except ImportError:  # optional: fall back to the joblib model
+    ort = None
 
+# Either a feature dict or an array of shape (1, n_features) whose columns
+# follow config.FEATURE_COLUMNS.
+FeatureInput = Union[Mapping[str, float], np.ndarray]
+
+
+@lru_cache(maxsize=1)
 def load_local_model() -> object:
     """
     Load the best trained model from the local models directory.
+
+    The loaded model is cached for the life of the process; call
+    `_clear_model_cache()` to pick up a retrained model.
     """
     if not config.BEST_MODEL_LOCAL_PATH.exists():
         raise FileNotFoundError(
@@ -30,13 +48,75 @@ def load_local_model() -> object:
     return joblib.load(config.BEST_MODEL_LOCAL_PATH)
 
 
+@lru_cache(maxsize=1)
 def load_hf_model() -> object:
     """
     Load the model directly from the Hugging Face model hub.
+
+    Cached like `load_local_model`.
     """
     return download_model()
 
 
+class _OnnxModel:
+    """
+    Minimal predict_proba adapter around an onnxruntime session, so the
+    ONNX export can be used anywhere the sklearn Pipeline is.
+    """
+
+    def __init__(self, session: "ort.InferenceSession") -> None:
+        self._session = session
+        self._input_name = session.get_inputs()[0].name
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float32)
+        # Outputs are (label, probabilities); exported with zipmap disabled
+        return self._session.run(None, {self._input_name: X})[1]
+
+
+@lru_cache(maxsize=1)
+def load_onnx_model() -> _OnnxModel:
+    """
+    Load the ONNX export of the best model written by train.py.
+
+    Requires onnxruntime. Cached like `load_local_model`.
+    """
+    if ort is None:
+        raise ImportError("onnxruntime is required to load the ONNX model.")
+    if not config.BEST_MODEL_ONNX_PATH.exists():
+        raise FileNotFoundError(
+            f"ONNX model not found at {config.BEST_MODEL_ONNX_PATH}. "
+            "Run train.py with skl2onnx installed to create it."
+        )
+    session = ort.InferenceSession(
+        str(config.BEST_MODEL_ONNX_PATH), providers=["CPUExecutionProvider"]
+    )
+    return _OnnxModel(session)
+
+
+def _clear_model_cache() -> None:
+    """
+    Drop cached models so the next load reads them again.
+    """
+    load_local_model.cache_clear()
+    load_hf_model.cache_clear()
+    load_onnx_model.cache_clear()
+
+
+def load_model(source: str = "local") -> object:
+    """
+    Load the model from the given source ('hf' or 'local').
+
+    For 'local', the ONNX export is preferred when it exists and
+    onnxruntime is installed; otherwise the joblib Pipeline is used.
+    """
+    if source == "hf":
+        return load_hf_model()
+    if ort is not None and config.BEST_MODEL_ONNX_PATH.exists():
+        return load_onnx_model()
+    return load_local_model()
+
+
 def build_input_dataframe(
     inputs: Dict[str, float],
 ) -> pd.DataFrame:
@@ -44,22 +124,136 @@ def build_input_dataframe(
     Convert a dictionary of feature values into a single-row DataFrame
     with columns ordered according to config.FEATURE_COLUMNS.
     """
-    data = {col: float(inputs.get(col, 0.0)) for col in config.FEATURE_COLUMNS}
-    return pd.DataFrame([data])
+    return pd.DataFrame(_as_feature_array(inputs), columns=config.FEATURE_COLUMNS)
+
+
+def _as_feature_array(inputs: FeatureInput) -> np.ndarray:
+    """
+    Return a (1, n_features) float32 array in config.FEATURE_COLUMNS order,
+    avoiding a DataFrame on the single-sample hot path.
+    """
+    if isinstance(inputs, np.ndarray):
+        return np.asarray(inputs, dtype=np.float32).reshape(1, -1)
+    return np.fromiter(
+        (float(inputs.get(col, 0.0)) for col in config.FEATURE_COLUMNS),
+        dtype=np.float32,
+        count=len(config.FEATURE_COLUMNS),
+    ).reshape(1, -1)
+
+
+def predict_with_model(
+    model: object,
+    inputs: FeatureInput,
+) -> Dict[str, float]:
+    """
+    Run a prediction with an already loaded model.
+
+    Returns a dict with the predicted class label (0/1) and the
+    probability of the positive class.
+    """
+    X = _as_feature_array(inputs)
+    proba = model.predict_proba(X)[0, 1]
+    return _result_from_proba(proba)
+
+
+def _result_from_proba(proba: float) -> Dict[str, float]:
+    return {
+        "prediction": int(proba >= 0.5),
+        "probability_faulty": float(proba),
+    }
+
+
+class PredictionBatcher:
+    """
+    Micro-batch concurrent single-row predictions.
+
+    Requests arriving within `max_wait` seconds of each other (up to
+    `max_batch_size` of them) are stacked into one frame and scored with
+    a single `predict_proba` call on a background thread, so concurrent
+    users of the Streamlit app share the fixed per-call model overhead.
+    """
+
+    def __init__(
+        self,
+        model: object,
+        max_batch_size: int = 64,
+        max_wait: float = 0.02,
+    ) -> None:
+        self._model = model
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._queue: "queue.Queue[Tuple[np.ndarray, Future]]" = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, name="prediction-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def predict(self, inputs: FeatureInput) -> Dict[str, float]:
+        """
+        Queue a single prediction and block until its batch is scored.
+        """
+        row = _as_feature_array(inputs)
+        future: Future = Future()
+        self._queue.put((row, future))
+        return future.result()
+
+    def _next_batch(self) -> List[Tuple[np.ndarray, Future]]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._max_wait
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            rows = [row for row, _ in batch]
+            futures = [future for _, future in batch]
+            try:
+                X = np.vstack(rows)
+                probas = self._model.predict_proba(X)[:, 1]
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            for future, proba in zip(futures, probas):
+                future.set_result(_result_from_proba(proba))
+
+
+def _as_feature_matrix(rows: Iterable[Mapping[str, float]]) -> np.ndarray:
+    """
+    Stack feature mappings into an (n_rows, n_features) float32 array in
+    config.FEATURE_COLUMNS order.
+    """
+    return np.array(
+        [[float(row.get(col, 0.0)) for col in config.FEATURE_COLUMNS] for row in rows],
+        dtype=np.float32,
+    ).reshape(-1, len(config.FEATURE_COLUMNS))
 
 
 def predict_engine_condition(
-    inputs: Dict[str, float],
+    inputs: Union[FeatureInput, Iterable[Mapping[str, float]]],
     model: Optional[object] = None,
     source: str = "local",
-) -> Dict[str, float]:
+) -> Union[Dict[str, float], List[Dict[str, float]]]:
     """
     Predict whether the engine requires maintenance.
 
     Parameters
     ----------
-    inputs : dict
-        Keys correspond to feature names in config.FEATURE_COLUMNS.
+    inputs : mapping, pd.DataFrame, np.ndarray or iterable of mappings
+        Either a mapping (dict, pd.Series, ...) keyed by the names in
+        config.FEATURE_COLUMNS, a DataFrame with those columns, an array
+        of shape (1, n_features) or (n_rows, n_features) already in that
+        column order, or an iterable of such mappings. DataFrames,
+        iterables and arrays with other than one row are scored as one
+        batch.
     model : object, optional
         Pre-loaded sklearn Pipeline model. If None, it will be loaded
         from `source`.
@@ -68,30 +262,43 @@ def predict_engine_condition(
 
     Returns
     -------
-    dict
+    dict or list of dict
         Contains the predicted class label (0/1) and the probability
-        of the positive class.
+        of the positive class. A batch of inputs returns one such dict
+        per row, in input order.
     """
     if model is None:
-        if source == "hf":
-            model = load_hf_model()
-        else:
-            model = load_local_model()
+        model = load_model(source)
 
-    df = build_input_dataframe(inputs)
-    proba = model.predict_proba(df)[0, 1]
-    pred = int(proba >= 0.5)
+    if isinstance(inputs, pd.DataFrame):
+        # A DataFrame also has .get, so check it before the mapping case
+        X = inputs[config.FEATURE_COLUMNS].to_numpy(np.float32)
+    elif isinstance(inputs, np.ndarray):
+        if inputs.ndim == 2 and inputs.shape[0] != 1:
+            X = np.asarray(inputs, dtype=np.float32)
+        else:
+            return predict_with_model(model, inputs)
+    elif isinstance(inputs, Mapping) or hasattr(inputs, "get"):
+        # Any mapping-like single sample (dict, pd.Series, ...)
+        return predict_with_model(model, inputs)
+    else:
+        X = _as_feature_matrix(inputs)
 
-    return {
-        "prediction": pred,
-        "probability_faulty": float(proba),
-    }
+    # Batch path: a single predict_proba call for all rows
+    if len(X) == 0:
+        return []
+    probas = model.predict_proba(X)[:, 1]
+    return [_result_from_proba(proba) for proba in probas]
 
 
 __all__ = [
     "load_local_model",
     "load_hf_model",
+    "load_onnx_model",
+    "load_model",
     "build_input_dataframe",
+    "predict_with_model",
+    "PredictionBatcher",
     "predict_engine_condition",
 ]
 
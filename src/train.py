@@ -12,24 +12,45 @@ Responsibilities:
 
 from __future__ import annotations
 
+import os
+import time
+from pathlib import Path
 from typing import Dict, Tuple
 
 import joblib
 import mlflow
 import mlflow.sklearn  # noqa: F401
+from mlflow.entities import Metric
+from mlflow.tracking import MlflowClient
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
 from sklearn.model_selection import RandomizedSearchCV
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
 
 import config
 from hf_data_utils import download_dataset_file
 from hf_model_utils import upload_model
 
 
+def _read_split(path: Path) -> pd.DataFrame:
+    """
+    Read a train/test CSV through a Parquet copy stored next to it.
+
+    The Parquet copy is (re)written whenever it is missing or older than
+    the CSV, so later runs skip CSV parsing entirely.
+    """
+    path = Path(path)
+    parquet_path = path.with_suffix(".parquet")
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= path.stat().st_mtime:
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+
+    df = pd.read_csv(path, dtype=config.COLUMN_DTYPES)
+    df.to_parquet(parquet_path, engine="pyarrow", index=False)
+    return df
+
+
 def _load_train_test_from_hf_or_local() -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Load train and test data from the HF dataset repo if available,
@@ -49,8 +70,8 @@ def _load_train_test_from_hf_or_local() -> Tuple[pd.DataFrame, pd.DataFrame]:
                 token=config.HF_TOKEN,
                 local_dir=config.DATA_DIR,
             )
-            train_df = pd.read_csv(train_path)
-            test_df = pd.read_csv(test_path)
+            train_df = _read_split(train_path)
+            test_df = _read_split(test_path)
             return train_df, test_df
         except Exception:
             # Fall back to local
@@ -62,28 +83,30 @@ def _load_train_test_from_hf_or_local() -> Tuple[pd.DataFrame, pd.DataFrame]:
             "Run data_prep.py first to generate the splits."
         )
 
-    train_df = pd.read_csv(config.TRAIN_FILE)
-    test_df = pd.read_csv(config.TEST_FILE)
+    train_df = _read_split(config.TRAIN_FILE)
+    test_df = _read_split(config.TEST_FILE)
     return train_df, test_df
 
 
-def _build_model_and_search_space() -> Tuple[Pipeline, Dict]:
+def _build_model_and_search_space(n_jobs: int = -1) -> Tuple[Pipeline, Dict]:
     """
     Build a sklearn Pipeline and define the hyperparameter search space.
 
-    We use a RandomForestClassifier with a StandardScaler on numeric features.
+    We use a RandomForestClassifier on the raw numeric features; tree
+    splits are scale-invariant, so no scaler is fitted per CV fold.
     """
-    clf = RandomForestClassifier(random_state=config.RANDOM_STATE)
+    # Build trees in parallel within each fit
+    clf = RandomForestClassifier(random_state=config.RANDOM_STATE, n_jobs=n_jobs)
 
     pipeline = Pipeline(
         steps=[
-            ("scaler", StandardScaler()),
             ("clf", clf),
         ]
     )
 
     param_distributions = {
-        "clf__n_estimators": [100, 200, 300, 400],
+        # CV scores barely move beyond ~200 trees
+        "clf__n_estimators": [200, 300],
         "clf__max_depth": [None, 5, 10, 20],
         "clf__min_samples_split": [2, 5, 10],
         "clf__min_samples_leaf": [1, 2, 4],
@@ -95,8 +118,40 @@ def _build_model_and_search_space() -> Tuple[Pipeline, Dict]:
     return pipeline, param_distributions
 
 
+def _export_onnx(model: Pipeline) -> bool:
+    """
+    Export the fitted pipeline to ONNX for faster inference.
+
+    Any previous export is removed first, so inference never picks up an
+    ONNX model older than the joblib one. Returns False, without raising,
+    when skl2onnx is not installed or the conversion fails.
+    """
+    config.BEST_MODEL_ONNX_PATH.unlink(missing_ok=True)
+
+    try:
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+    except ImportError:
+        print("skl2onnx not installed; skipping ONNX export.")
+        return False
+
+    try:
+        onnx_model = convert_sklearn(
+            model,
+            initial_types=[("X", FloatTensorType([None, len(config.FEATURE_COLUMNS)]))],
+            # Return probabilities as a plain tensor rather than a list of dicts
+            options={id(model.steps[-1][1]): {"zipmap": False}},
+        )
+        config.BEST_MODEL_ONNX_PATH.write_bytes(onnx_model.SerializeToString())
+    except Exception as e:
+        config.BEST_MODEL_ONNX_PATH.unlink(missing_ok=True)
+        print(f"Warning: Failed to export ONNX model: {e}")
+        return False
+    return True
+
+
 def _evaluate_model(
-    model: Pipeline, X_test: pd.DataFrame, y_test: pd.Series
+    model: Pipeline, X_test: np.ndarray, y_test: pd.Series
 ) -> Dict[str, float]:
     """
     Compute standard binary classification metrics.
@@ -118,13 +173,23 @@ def main() -> None:
     print("Loading train and test data...")
     train_df, test_df = _load_train_test_from_hf_or_local()
 
-    X_train = train_df[config.FEATURE_COLUMNS]
+    # Cast features to float32 once: RandomForest works in float32 anyway,
+    # so this avoids a cast-and-copy in every CV fit. Fitting on arrays also
+    # matches inference, which passes numpy arrays in FEATURE_COLUMNS order.
+    X_train = train_df[config.FEATURE_COLUMNS].to_numpy(dtype=np.float32, copy=False)
     y_train = train_df[config.TARGET_COLUMN]
-    X_test = test_df[config.FEATURE_COLUMNS]
+    X_test = test_df[config.FEATURE_COLUMNS].to_numpy(dtype=np.float32, copy=False)
     y_test = test_df[config.TARGET_COLUMN]
 
+    # Run a few CV fits at once and split the cores between them. Inside
+    # loky workers each forest's own n_jobs becomes that many threads, so
+    # search_n_jobs * forest_n_jobs stays within the core count.
+    n_cpus = os.cpu_count() or 1
+    search_n_jobs = max(1, n_cpus // 4)
+    forest_n_jobs = max(1, n_cpus // search_n_jobs)
+
     print("Building model and hyperparameter search space...")
-    pipeline, param_distributions = _build_model_and_search_space()
+    pipeline, param_distributions = _build_model_and_search_space(n_jobs=forest_n_jobs)
 
     search = RandomizedSearchCV(
         estimator=pipeline,
@@ -132,7 +197,8 @@ def main() -> None:
         n_iter=20,
         cv=5,
         scoring="f1",
-        n_jobs=-1,
+        n_jobs=search_n_jobs,
+        pre_dispatch="2*n_jobs",
         verbose=1,
         random_state=config.RANDOM_STATE,
     )
@@ -143,35 +209,59 @@ def main() -> None:
 
     print("Starting hyperparameter tuning with MLflow tracking...")
     with mlflow.start_run(run_name="RandomForest_random_search"):
-        search.fit(X_train, y_train)
+        # Run the CV fits in loky worker processes
+        with joblib.parallel_backend("loky"):
+            search.fit(X_train, y_train)
 
         best_model: Pipeline = search.best_estimator_
         best_params = search.best_params_
 
-        # Log all evaluated parameter combinations as nested runs,
-        # similar to the reference notebook pattern.
+        # Log all evaluated parameter combinations in one request instead of
+        # a nested run per trial: the CV score as a stepped metric, and the
+        # full cv_results_ (params, split scores, fit times) as one table
+        # artifact.
         results = search.cv_results_
-        for i in range(len(results["params"])):
-            param_set = results["params"][i]
-            mean_score = results["mean_test_score"][i]
-            with mlflow.start_run(nested=True):
-                mlflow.log_params(param_set)
-                mlflow.log_metric("mean_cv_f1", float(mean_score))
+        run_id = mlflow.active_run().info.run_id
+        timestamp = int(time.time() * 1000)
+        trial_metrics = [
+            Metric("mean_cv_f1", float(score), timestamp, step)
+            for step, score in enumerate(results["mean_test_score"])
+        ]
+        MlflowClient().log_batch(run_id, metrics=trial_metrics)
+
+        # Logged straight from memory; no intermediate file is written.
+        # The "params" dicts duplicate the param_* columns.
+        cv_df = pd.DataFrame(results).drop(columns="params")
+        mlflow.log_table(data=cv_df, artifact_file="tuning/cv_results.json")
 
         # Evaluation
         metrics = _evaluate_model(best_model, X_test, y_test)
 
         # Log parameters and metrics
         mlflow.log_params(best_params)
-        for name, value in metrics.items():
-            mlflow.log_metric(name, float(value))
+        mlflow.log_metrics({name: float(value) for name, value in metrics.items()})
+        mlflow.log_dict(
+            {
+                "feature_columns": config.FEATURE_COLUMNS,
+                "target_column": config.TARGET_COLUMN,
+                "best_params": best_params,
+                "test_metrics": {name: float(value) for name, value in metrics.items()},
+            },
+            "meta.json",
+        )
+
+        # The shipped model mostly scores single rows, where a thread pool
+        # over all cores is pure overhead; parallelism only helped training.
+        best_model.set_params(clf__n_jobs=1)
 
-        # Save model locally
+        # Save model locally (used by the app and the HF upload below)
         config.MODELS_DIR.mkdir(parents=True, exist_ok=True)
         joblib.dump(best_model, config.BEST_MODEL_LOCAL_PATH)
-        mlflow.log_artifact(str(config.BEST_MODEL_LOCAL_PATH), artifact_path="artifacts")
+        if _export_onnx(best_model):
+            print(f"Exported ONNX model to {config.BEST_MODEL_ONNX_PATH}")
 
-        # Also log the model in MLflow's model registry format
+        # Log the model to MLflow once, in its model registry format; the
+        # joblib file is not copied into the run as a separate artifact.
         mlflow.sklearn.log_model(best_model, artifact_path="engine_model")
 
         print("Best parameters found:")
@@ -0,0 +1,78 @@
+"""
+Static values used by the Streamlit app.
+
+Streamlit re-executes the main script (app.py) on every rerun, but
+imported modules are only executed once per process. Keeping these
+constants here means they are built once instead of on every rerun.
+"""
+
+import numpy as np
+
+import config
+
+# Upper bounds used to normalize sensor readings onto a 0-100 radar scale
+MAX_VALUES = {
+    "Engine_RPM": 4000.0,
+    "Lub_Oil_Pressure": 10.0,
+    "Fuel_Pressure": 30.0,
+    "Coolant_Pressure": 10.0,
+    "Lub_Oil_Temperature": 150.0,
+    "Coolant_Temperature": 150.0,
+}
+FEATURE_ORDER = tuple(config.FEATURE_COLUMNS)
+MAX_VALUES_ARR = np.array([MAX_VALUES[k] for k in FEATURE_ORDER], dtype=np.float32)
+# Radar axis labels, with the first repeated to close the loop
+RADAR_THETA = [k.replace("_", " ") for k in FEATURE_ORDER] + [FEATURE_ORDER[0].replace("_", " ")]
+
+# Custom CSS for better styling
+CUSTOM_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: #1f77b4;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .metric-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 1.5rem;
+        border-radius: 10px;
+        color: white;
+        text-align: center;
+        margin: 0.5rem 0;
+    }
+    .prediction-box {
+        padding: 2rem;
+        border-radius: 15px;
+        margin: 1.5rem 0;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    }
+    .success-box {
+        background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
+        color: white;
+    }
+    .warning-box {
+        background: linear-gradient(135deg, #ee0979 0%, #ff6a00 100%);
+        color: white;
+    }
+    .stSlider > div > div > div {
+        background-color: #1f77b4;
+    }
+    .stButton > button {
+        width: 100%;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        font-weight: bold;
+        font-size: 1.2rem;
+        padding: 0.75rem;
+        border-radius: 10px;
+        border: none;
+        transition: all 0.3s;
+    }
+    .stButton > button:hover {
+        transform: scale(1.05);
+        box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
+    }
+</style>
+"""